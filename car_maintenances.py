@@ -4,13 +4,26 @@ from tkinter import font as tkfont
 from tkinter.filedialog import askopenfilename
 from pathlib import Path
 from datetime import datetime, date
-from dateutil.relativedelta import relativedelta
-import pandas as pd
-import yaml
+from calendar import monthrange
+from functools import lru_cache
+import json
+import csv
+import hashlib
 import re
 
+# pandas, numpy and yaml are imported inside the functions that use
+# them, so the vehicle picker opens without waiting on those imports.
+
+try:
+    import ahocorasick  # optional: one keyword scan for all rules
+except ImportError:
+    ahocorasick = None
+
 APP_TITLE = "Car Maintenances"
 HERE = Path(".").resolve()
+MIRROR_STAMP_KEY = b"csv_stamp"  # feather schema metadata: "MIRROR_FORMAT size mtime_ns"
+MIRROR_FORMAT = "v1"  # bump whenever read_data parses the CSV differently
+RULES_NAME_RE = re.compile(r"^(.*)_schedule_rules\.ya?ml$", re.IGNORECASE)
 
 # ---------------- File pairing helpers ----------------
 
@@ -24,91 +37,338 @@ def rules_to_data_path(rules_path: Path) -> Path:
     If the pattern isn't exact, fall back to replacing the suffix.
     """
     name = rules_path.name
-    m = re.match(r"^(.*)_schedule_rules\.ya?ml$", name, flags=re.IGNORECASE)
+    m = RULES_NAME_RE.match(name)
     if m:
         return rules_path.with_name(f"{m.group(1)}_data.csv")
     # fallback
     stem = rules_path.stem.replace("_schedule_rules", "")
     return rules_path.with_name(f"{stem}_data.csv")
 
+def data_mirror_path(data_path: Path) -> Path:
+    """'Something_data.csv' -> 'Something_data.feather' (binary read cache)."""
+    return data_path.with_suffix(".feather")
+
+def data_stamp(data_path: Path):
+    """(size, mtime_ns) of the history CSV, or None when it is missing."""
+    try:
+        st = data_path.stat()
+    except OSError:
+        return None
+    return (st.st_size, st.st_mtime_ns)
+
+def rules_cache_path(rules_path: Path) -> Path:
+    """'Something_schedule_rules.yaml' -> 'Something_schedule_rules.cache.json'."""
+    return rules_path.with_suffix(".cache.json")
+
 # ---------------- Core logic ----------------
 
 def ensure_data(path: Path):
-    """Ensure the CSV exists with expected columns."""
+    """
+    Ensure the CSV exists and starts with date,mileage,service,note in that
+    order (any extra columns are kept after them), so append_record can add
+    rows positionally. Uses the csv module so startup never imports pandas.
+    """
+    needed = ["date", "mileage", "service", "note"]
     if not path.exists():
-        pd.DataFrame(columns=["date", "mileage", "service", "note"]).to_csv(path, index=False)
-    else:
-        df = pd.read_csv(path)
-        changed = False
-        if "note" not in df.columns:
-            df["note"] = ""
-            changed = True
-        needed = ["date", "mileage", "service", "note"]
-        for c in needed:
-            if c not in df.columns:
-                df[c] = "" if c != "mileage" else 0
-                changed = True
-        if changed:
-            df[["date","mileage","service","note"]].to_csv(path, index=False)
+        with path.open("w", newline="", encoding="utf-8") as f:
+            csv.writer(f, lineterminator="\n").writerow(needed)
+        return
+    # utf-8-sig drops the BOM spreadsheet apps like to add
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), [])
+    if header[:len(needed)] == needed:
+        return
+    # rare: reorder / add columns, then rewrite the file once
+    with path.open(newline="", encoding="utf-8-sig") as f:
+        rows = list(csv.DictReader(f))
+    missing = {c: ("0" if c == "mileage" else "") for c in needed if c not in header}
+    extra = [c for c in header if c not in needed]
+    with path.open("w", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=needed + extra, extrasaction="ignore", lineterminator="\n")
+        w.writeheader()
+        for row in rows:
+            w.writerow({**missing, **row})
+
+def append_record(path: Path, row):
+    """
+    Append one row to the history CSV. Recreates the header when the file has
+    gone missing or been emptied and adds the final newline a hand edit may have
+    dropped, so the row never gets glued onto the previous one.
+    """
+    if not path.exists() or path.stat().st_size == 0:
+        ensure_data(path)
+    with path.open("rb+") as f:
+        f.seek(0, 2)
+        if f.tell():
+            f.seek(-1, 2)
+            if f.read(1) not in (b"\n", b"\r"):
+                f.write(b"\n")
+    with path.open("a", newline="", encoding="utf-8") as f:
+        csv.writer(f, lineterminator="\n").writerow(row)
+
+def read_data(path: Path):
+    """
+    Read the history CSV, preferring pandas' pyarrow engine when it is installed.
+    Text columns are read as strings (no type inference) and dates are parsed
+    once into parsed_date; 'date' keeps the original text for display.
+    A mileage column that did not come back numeric is cleaned to numbers.
+    With pyarrow, the parsed frame is mirrored to a .feather file stamped with
+    the CSV's size and mtime_ns; it is read instead only while both still match.
+    """
+    import pandas as pd
+    mirror = data_mirror_path(path)
+    # CSV size/mtime taken before the read, so a CSV changed mid-read misses
+    stamp = " ".join(map(str, (MIRROR_FORMAT, *(data_stamp(path) or ())))).encode()
+    try:
+        import pyarrow as pa
+        with pa.memory_map(str(mirror)) as source:
+            mirror_stamp = (pa.ipc.open_file(source).schema.metadata or {}).get(MIRROR_STAMP_KEY)
+        if mirror_stamp == stamp:
+            return pd.read_feather(mirror)
+    except (OSError, ImportError, ValueError):
+        pass
+    text_cols = ["date", "service", "note"]
+    try:
+        df = pd.read_csv(path, engine="pyarrow", dtype_backend="pyarrow",
+                         dtype=dict.fromkeys(text_cols, "string[pyarrow]"))
+    except (ImportError, ValueError, TypeError):
+        # no pyarrow, or pandas < 2.0 without dtype_backend
+        df = pd.read_csv(path, dtype=dict.fromkeys(text_cols, "string"))
+    if not pd.api.types.is_numeric_dtype(df["mileage"]):
+        # hand-edited rows like "45,120 mi": keep the first number, blank -> NaN
+        df["mileage"] = pd.to_numeric(
+            df["mileage"].astype("string").str.replace(",", "", regex=False)
+            .str.extract(r"(\d+(?:\.\d+)?)", expand=False),
+            errors="coerce")
+    df["parsed_date"] = pd.to_datetime(df["date"], format="%m/%d/%Y", errors="coerce")
+    try:
+        import pyarrow as pa
+        from pyarrow import feather
+        table = pa.Table.from_pandas(df)
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), MIRROR_STAMP_KEY: stamp})
+        feather.write_feather(table, str(mirror))
+    except (OSError, ImportError, ValueError):
+        pass
+    return df
+
+@lru_cache(maxsize=4096)
+def _parse_date_us_cached(s: str):
+    return datetime.strptime(s, "%m/%d/%Y").date()
 
 def parse_date_us(s):
     """Parse MM/DD/YYYY -> date."""
     try:
-        return datetime.strptime(str(s), "%m/%d/%Y").date()
+        return _parse_date_us_cached(s if isinstance(s, str) else str(s))
     except Exception:
         return None
 
 def parse_flexible_date(s):
-    """Try MM/DD/YYYY then YYYY-MM-DD; return date or None."""
+    """Accept a date, ISO date/timestamp text or MM/DD/YYYY; return date or None."""
     if not s:
         return None
+    # YAML hands over ISO baseline dates as date objects, the rules cache as text
+    if isinstance(s, datetime):
+        return s.date()
+    if isinstance(s, date):
+        return s
+    s = str(s)
+    if len(s) >= 10 and s[4] == "-" and s[7] == "-":
+        # ISO date or timestamp (YAML datetimes are cached in isoformat())
+        try:
+            return datetime.fromisoformat(s).date()
+        except ValueError:
+            return None
     for fmt in ("%m/%d/%Y", "%Y-%m-%d"):
         try:
-            return datetime.strptime(str(s), fmt).date()
+            return datetime.strptime(s, fmt).date()
         except Exception:
             pass
     return None
 
+def _add_months(d, n):
+    """d plus n calendar months, clamping the day to the target month's length."""
+    y, m = divmod(d.month - 1 + n, 12)
+    year, month = d.year + y, m + 1
+    return date(year, month, min(d.day, monthrange(year, month)[1]))
+
 def load_rules(rules_file: Path):
     """Load YAML rules; expect {vehicle_name: str, rules: list}."""
     if not rules_file.exists():
         messagebox.showerror("Rules Missing", f"Could not find {rules_file}")
         return {"vehicle_name": "Unknown Vehicle", "rules": []}
-    data = yaml.safe_load(rules_file.read_text(encoding="utf-8"))
+    raw = rules_file.read_bytes()
+    # the JSON sidecar is keyed by the YAML's content hash, so touched or copied
+    # files still hit and any edit misses, whatever the mtimes say
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    data = None
+    cache = rules_cache_path(rules_file)
+    try:
+        cached = json.loads(cache.read_bytes())
+        if cached.get("yaml_digest") == digest:
+            data = cached.get("data")
+    except (OSError, ValueError, AttributeError):
+        data = None
+    if data is None:
+        import yaml
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:
+            from yaml import SafeLoader
+        data = yaml.load(raw.decode("utf-8"), Loader=SafeLoader)
+        if isinstance(data, dict):
+            # dates/timestamps are stored as ISO text, which parse_flexible_date reads back
+            def to_json(o):
+                return o.isoformat() if isinstance(o, date) else str(o)
+            try:
+                cache.write_text(json.dumps({"yaml_digest": digest, "data": data}, default=to_json), encoding="utf-8")
+            except OSError:
+                pass
     if not isinstance(data, dict):
         messagebox.showerror("Rules Error", "Rules file must be a YAML mapping with vehicle_name and rules.")
         return {"vehicle_name": "Unknown Vehicle", "rules": []}
     data.setdefault("vehicle_name", "Unknown Vehicle")
     data.setdefault("rules", [])
+    rules = data["rules"] if isinstance(data["rules"], list) else []
+    problems = [f"Rule #{i + 1} is not a mapping" for i, r in enumerate(rules) if not isinstance(r, dict)]
+    data["rules"] = [r for r in rules if isinstance(r, dict)]
+    for rule in data["rules"]:
+        problems += prepare_rule(rule)
+    # combobox choices, built once per load instead of on every UI build
+    data["_labels"] = [r.get("label", r.get("key", "")) for r in data["rules"]] + ["Other"]
+    if problems:
+        messagebox.showerror("Rules Error", "Some rules need attention:\n" + "\n".join(problems))
     return data
 
+def prepare_rule(rule):
+    """
+    Coerce a rule's per-click invariants once, at load time: int intervals,
+    trigger flag, lowercase keywords and their regex alternation (underscore keys).
+    Returns a list of problems found; bad intervals are treated as 0.
+    """
+    problems = []
+    label = rule.get("label", rule.get("key", "Unnamed"))
+    for field, attr in (("miles_interval", "_miles"), ("months_interval", "_months")):
+        try:
+            rule[attr] = int(rule.get(field, 0) or 0)
+        except (TypeError, ValueError):
+            rule[attr] = 0
+            problems.append(f"{label}: {field} must be a number")
+    rule["_trigger"] = str(rule.get("trigger", "earliest")).strip().lower()
+    rule["_mileage_only"] = rule["_trigger"] == "mileage_only"
+    match = rule.get("match") or []
+    if isinstance(match, str):
+        match = [match]
+    rule["_match_lower"] = [str(kw).lower() for kw in match if kw]
+    rule["_pattern"] = "|".join(re.escape(kw) for kw in rule["_match_lower"]) or None
+    return problems
+
 def normalize_services(df):
-    """Lowercase copy for keyword matching; keep original text and note."""
+    """
+    Lowercase copy for keyword matching; keep original text and note, and add
+    parsed_date (MM/DD/YYYY, NaT when unparseable) unless read_data already did.
+    Repeated entries (same date/mileage/service) are dropped, keeping the last.
+    """
+    import pandas as pd
     df = df.copy()
     if "service" not in df.columns:
         df["service"] = ""
     if "note" not in df.columns:
         df["note"] = ""
+    df = df.drop_duplicates(subset=["date", "mileage", "service"], keep="last")
     df["service_text"] = df["service"].astype(str)
     df["service_norm"] = df["service_text"].str.lower()
+    try:
+        # Arrow-backed strings let str.contains run in Arrow's compute kernels
+        df["service_norm"] = df["service_norm"].astype("string[pyarrow]")
+    except ImportError:
+        pass
+    # few distinct services: keywords are matched per category, not per row
+    df["service_norm"] = df["service_norm"].astype("category")
+    if "parsed_date" not in df.columns:
+        df["parsed_date"] = pd.to_datetime(df["date"], format="%m/%d/%Y", errors="coerce")
     return df
 
-def last_event_for_rule(df, rule):
+def match_mask(df, rule):
+    """Boolean array of rows whose service text contains any of the rule's keywords."""
+    return rule_masks(df, [rule])[0]
+
+def category_hits(categories, rule):
+    """Boolean array over the distinct service strings that match the rule."""
+    import numpy as np
+    kws = rule["_match_lower"]
+    if not kws:
+        return np.zeros(len(categories), dtype=bool)
+    if len(kws) == 1:
+        # a lone keyword is a plain substring search; skip the regex engine
+        hit = categories.str.contains(kws[0], regex=False)
+    else:
+        hit = categories.str.contains(rule["_pattern"], regex=True)
+    return np.asarray(hit, dtype=bool)
+
+def build_automaton(rules):
+    """Aho-Corasick automaton mapping each keyword to the rule indexes using it, or None."""
+    if ahocorasick is None:
+        return None
+    owners = {}
+    for i, rule in enumerate(rules):
+        for kw in rule["_match_lower"]:
+            owners.setdefault(kw, set()).add(i)
+    if not owners:
+        return None
+    automaton = ahocorasick.Automaton()
+    for kw, idxs in owners.items():
+        automaton.add_word(kw, tuple(sorted(idxs)))
+    automaton.make_automaton()
+    return automaton
+
+def rule_masks(df, rules, automaton=None):
+    """
+    One boolean array per rule marking the rows that match it. service_norm is
+    categorical, so each distinct service string is matched once and the result
+    is spread to the rows through the category codes.
+    """
+    import numpy as np
+    service = df["service_norm"].cat
+    categories, codes = service.categories, service.codes.to_numpy()
+    hits = np.zeros((len(rules), len(categories) + 1), dtype=bool)
+    if automaton is None:
+        for i, rule in enumerate(rules):
+            hits[i, :-1] = category_hits(categories, rule)
+    else:
+        # single pass over the distinct services classifies them against every rule
+        for c, text in enumerate(categories):
+            for _, idxs in automaton.iter(text):
+                hits[list(idxs), c] = True
+    # code -1 (missing service) picks the trailing all-False column
+    return list(hits[:, codes])
+
+def last_event_for_rule(df, rule, mask=None):
     """
     Find most recent row matching any keyword. If none found, synthesize a
     baseline event from rule['baseline_date'] / rule['baseline_mileage'] if provided.
-    Returns a dict similar to a CSV row (keys used by caller): 
-    'service_text','date','mileage','note'
+    Returns a (service_text, date, mileage, parsed_date, note) tuple or None;
+    parsed_date is a datetime.date; date, mileage and parsed_date are None when
+    the row left them blank.
+    df must already be sorted by (parsed_date, mileage), as compute_next_due does.
     """
+    import numpy as np
+    import pandas as pd
     # try CSV matches first
-    mask = pd.Series(False, index=df.index)
-    for kw in rule.get("match", []):
-        mask |= df["service_norm"].str.contains(kw, na=False)
-    hits = df[mask].copy()
-    if not hits.empty:
-        hits["parsed_date"] = hits["date"].apply(parse_date_us)
-        hits = hits.sort_values(["parsed_date","mileage"], ascending=[True, True])
-        return hits.iloc[-1].to_dict()
+    if mask is None:
+        mask = match_mask(df, rule)
+    hits = np.flatnonzero(mask)
+    if hits.size:
+        i = hits[-1]
+        parsed = df["parsed_date"].iat[i]
+        raw_date, mileage, note = df["date"].iat[i], df["mileage"].iat[i], df["note"].iat[i]
+        # blank cells come back as pd.NA / NaN; hand None to the caller instead
+        return (
+            df["service_text"].iat[i],
+            None if pd.isna(raw_date) else raw_date,
+            None if pd.isna(mileage) else mileage,
+            parsed.date() if pd.notnull(parsed) else None,
+            "" if pd.isna(note) else note,
+        )
 
     # fall back to baseline in YAML
     b_date_raw = rule.get("baseline_date")
@@ -126,37 +386,45 @@ def last_event_for_rule(df, rule):
 
     # Build a pseudo "last event"
     label = rule.get("label", rule.get("key", "Baseline"))
-    return {
-        "service_text": f"(baseline) {label}",
-        "date": b_date.strftime("%m/%d/%Y") if b_date else None,
-        "mileage": b_mi,
-        "note": "Baseline from schedule rules"
-    }
-
-def compute_next_due(df, current_mileage, today, rules):
+    return (
+        f"(baseline) {label}",
+        b_date.strftime("%m/%d/%Y") if b_date else None,
+        b_mi,
+        b_date,
+        "Baseline from schedule rules",
+    )
+
+def compute_next_due(df, current_mileage, today, rules, automaton=None):
     """Compute due status per rule; return list for rendering."""
+    import pandas as pd
     results = []
-    for rule in rules:
-        miles_int = int(rule.get("miles_interval", 0) or 0)
-        months_int = int(rule.get("months_interval", 0) or 0)
-        trigger = str(rule.get("trigger", "earliest")).lower()
+    # sort once so the last matching row of every rule is its most recent event
+    df = df.sort_values(["parsed_date", "mileage"]).reset_index(drop=True)
+    masks = rule_masks(df, rules, automaton)
+    for rule, mask in zip(rules, masks):
+        miles_int = rule["_miles"]
+        months_int = rule["_months"]
+        mileage_only = rule["_mileage_only"]
         label = rule.get("label", rule.get("key", "Unnamed"))
         rule_note = rule.get("note", "")
 
-        last = last_event_for_rule(df, rule)
+        last = last_event_for_rule(df, rule, mask)
+
+        last_service, last_date_str, last_mileage, last_date, last_note = last or ("(none)", None, None, None, "")
 
         due_mileage, due_date = None, None
         if last:
-            last_mi = float(last.get("mileage")) if pd.notnull(last.get("mileage")) else None
-            last_date = parse_flexible_date(last.get("date"))
+            last_mi = float(last_mileage) if pd.notnull(last_mileage) else None
+            if last_date is None:
+                last_date = parse_flexible_date(last_date_str)
             if miles_int > 0 and last_mi is not None:
                 due_mileage = last_mi + miles_int
-            if months_int > 0 and last_date is not None and trigger != "mileage_only":
-                due_date = last_date + relativedelta(months=+months_int)
+            if months_int > 0 and last_date is not None and not mileage_only:
+                due_date = _add_months(last_date, months_int)
         else:
             if miles_int > 0:
                 due_mileage = miles_int
-            if months_int > 0 and trigger != "mileage_only":
+            if months_int > 0 and not mileage_only:
                 due_date = today
 
         miles_until = None if due_mileage is None else int(due_mileage - current_mileage)
@@ -168,10 +436,10 @@ def compute_next_due(df, current_mileage, today, rules):
         results.append({
             "label": label,
             "rule_note": rule_note,
-            "last_service": last["service_text"] if last else "(none)",
-            "last_note": last.get("note") if last else "",
-            "last_date": last.get("date") if last else None,
-            "last_mileage": last.get("mileage") if last else None,
+            "last_service": last_service,
+            "last_note": last_note,
+            "last_date": last_date_str,
+            "last_mileage": last_mileage,
             "due_mileage": due_mileage,
             "due_date": due_date.strftime("%Y-%m-%d") if due_date else None,
             "miles_until": miles_until,
@@ -255,6 +523,9 @@ class App(tk.Tk):
         self.rules_data = {"vehicle_name":"Unknown Vehicle", "rules":[]}
         self.vehicle_name = "Unknown Vehicle"
         self.rules = []
+        self.automaton = None
+        self._df_cache = None    # normalized history, valid while data_stamp() is _df_stamp
+        self._df_stamp = None
 
         # Run picker immediately
         self.after(0, self.pick_car_and_build_ui)
@@ -280,6 +551,7 @@ class App(tk.Tk):
         self.rules_data = load_rules(self.rules_file)
         self.vehicle_name = self.rules_data.get("vehicle_name","Unknown Vehicle")
         self.rules = self.rules_data.get("rules",[])
+        self.automaton = build_automaton(self.rules)
 
         self.title(f"{APP_TITLE} — {self.vehicle_name}")
         self.build_ui()
@@ -310,8 +582,7 @@ class App(tk.Tk):
         ttk.Entry(mid, textvariable=self.rec_miles_var, width=12).grid(row=0, column=3, padx=4, pady=2)
 
         ttk.Label(mid, text="Service:").grid(row=0, column=4, sticky="w", padx=4, pady=2)
-        labels = [r.get("label", r.get("key", "")) for r in self.rules]
-        labels.append("Other")
+        labels = self.rules_data.get("_labels", ["Other"])
         self.service_combo = ttk.Combobox(mid, textvariable=self.service_var, values=labels, state="readonly", width=42)
         self.service_combo.grid(row=0, column=5, padx=4, pady=2)
 
@@ -354,17 +625,15 @@ class App(tk.Tk):
             return
 
         try:
-            df = pd.read_csv(self.data_file) if self.data_file.exists() else pd.DataFrame(columns=["date", "mileage", "service", "note"])
-            if "note" not in df.columns:
-                df["note"] = ""
-            df.loc[len(df)] = {"date": d, "mileage": m_val, "service": s, "note": n}
-            df[["date","mileage","service","note"]].to_csv(self.data_file, index=False)
+            append_record(self.data_file, [d, m_val, s, n])
+            self._df_stamp = None
             messagebox.showinfo("Added", f"Saved: {d} | {m_val} mi | {s}" + (f" | Note: {n}" if n else ""))
             self.rec_miles_var.set(""); self.service_var.set(""); self.note_var.set("")
         except Exception as e:
             messagebox.showerror("Write error", f"Could not write to data file:\n{e}")
 
     def compute(self):
+        import pandas as pd
         cur = self.mileage_var.get().strip()
         if not cur:
             messagebox.showwarning("Mileage needed", "Enter your current mileage first.")
@@ -375,23 +644,30 @@ class App(tk.Tk):
             messagebox.showwarning("Bad mileage", "Current mileage must be a number.")
             return
 
-        try:
-            df = pd.read_csv(self.data_file) if self.data_file.exists() else pd.DataFrame(columns=["date", "mileage", "service", "note"])
-        except Exception as e:
-            messagebox.showerror("Read error", f"Could not read data file:\n{e}")
-            return
+        stamp = data_stamp(self.data_file)
+        if self._df_cache is not None and stamp == self._df_stamp:
+            df = self._df_cache
+        else:
+            try:
+                df = read_data(self.data_file) if stamp is not None else pd.DataFrame(columns=["date", "mileage", "service", "note"])
+            except Exception as e:
+                messagebox.showerror("Read error", f"Could not read data file:\n{e}")
+                return
 
-        df = normalize_services(df)
+            df = normalize_services(df)
+            self._df_cache, self._df_stamp = df, stamp
         today = date.today()
-        rows = compute_next_due(df, current_mileage, today, self.rules)
+        rows = compute_next_due(df, current_mileage, today, self.rules, self.automaton)
 
-        self.text.delete("1.0", tk.END)
         header = (
             f"{self.vehicle_name} — Maintenance Reminders\n"
             f"Today: {today.strftime('%m/%d/%Y')} | Odometer: {int(current_mileage)} mi\n"
             + "-" * 72 + "\n"
         )
-        self.text.insert(tk.END, header)
+        # build the whole report first, then hand it to Tk in a single insert
+        out_parts = [header]
+        line = 1 + header.count("\n")  # Text line where the next block starts
+        tagged = {"OVERDUE": [], "upcoming": []}  # tag -> Text index pairs of status lines
 
         for r in rows:
             due_bits = []
@@ -403,18 +679,26 @@ class App(tk.Tk):
                 due_bits.append("no computed due date (check intervals/history)")
 
             status_line = f"[{r['status']}] {r['label']}: " + "; ".join(due_bits) + "\n"
-            start_idx = self.text.index(tk.INSERT)
-            self.text.insert(tk.END, status_line)
-            end_idx = self.text.index(tk.INSERT)
             tag_name = "OVERDUE" if r["status"] == "OVERDUE" else "upcoming"
-            self.text.tag_add(tag_name, start_idx, end_idx)
+            after = line + status_line.count("\n")
+            tagged[tag_name] += [f"{line}.0", f"{after}.0"]
 
-            self.text.insert(tk.END, f"  last: {r['last_service']} on {r['last_date']} @ {r['last_mileage']} mi\n")
+            block = [status_line, f"  last: {r['last_service']} on {r['last_date']} @ {r['last_mileage']} mi\n"]
             if r.get("last_note"):
-                self.text.insert(tk.END, f"  last note: {r['last_note']}\n")
+                block.append(f"  last note: {r['last_note']}\n")
             if r.get("rule_note"):
-                self.text.insert(tk.END, f"  schedule note: {r['rule_note']}\n")
-            self.text.insert(tk.END, "\n")
+                block.append(f"  schedule note: {r['rule_note']}\n")
+            block.append("\n")
+            block = "".join(block)
+            out_parts.append(block)
+            line += block.count("\n")
+
+        self.text.delete("1.0", tk.END)
+        self.text.insert(tk.END, "".join(out_parts))
+        # Tk's "tag add" takes any number of ranges: one call per tag
+        for tag_name, ranges in tagged.items():
+            if ranges:
+                self.text.tag_add(tag_name, *ranges)
 
 # ---------------- Run ----------------
 
@@ -1,28 +1,33 @@
+import os
 import pandas as pd
 
 FILE = "cardata.csv"
 DATE_COLUMN = "date"
+CHUNK_ROWS = 100_000
 
-def parse_mixed_date(x):
-    x = str(x)
-    if len(x) == 7:  # e.g., 5022018
-        return pd.to_datetime(x, format="%m%d%Y", errors="coerce")
-    elif len(x) == 8:  # e.g., 12052018
-        return pd.to_datetime(x, format="%m%d%Y", errors="coerce")
-    else:
-        return pd.NaT  # Not a valid date
+def parse_mixed_dates(col):
+    s = col.astype(str)
+    # 7 digits (e.g., 5022018) or 8 digits (e.g., 12052018); anything else is not a valid date.
+    # 7 digits always read as M/DD/YYYY: 1012018 is 01/01/2018, not 10/1/2018
+    # as the old per-value strptime guessed.
+    s = s.where(s.str.len().isin([7, 8]))
+    return pd.to_datetime(s.str.zfill(8), format="%m%d%Y", errors="coerce")
 
 def main():
-    df = pd.read_csv(FILE)
-
-    # Apply custom parser
-    df[DATE_COLUMN] = df[DATE_COLUMN].apply(parse_mixed_date)
-
-    # Save back as U.S. format
-    df[DATE_COLUMN] = df[DATE_COLUMN].dt.strftime("%m/%d/%Y")
-
-    # Overwrite the file
-    df.to_csv(FILE, index=False)
+    tmp = FILE + ".tmp"
+    try:
+        # Stream the file in chunks so memory stays flat however long the log is
+        with open(tmp, "w", newline="", encoding="utf-8") as out:
+            chunks = pd.read_csv(FILE, chunksize=CHUNK_ROWS, dtype={DATE_COLUMN: "string"})
+            for i, chunk in enumerate(chunks):
+                # Parse each chunk's column at once, save back as U.S. format
+                chunk[DATE_COLUMN] = parse_mixed_dates(chunk[DATE_COLUMN]).dt.strftime("%m/%d/%Y")
+                chunk.to_csv(out, index=False, header=(i == 0), lineterminator="\n")
+        # Overwrite the file only once everything was written
+        os.replace(tmp, FILE)
+    finally:
+        if os.path.exists(tmp):
+            os.remove(tmp)
     print(f"✅ Dates fixed (both 7- and 8-digit) and saved back to {FILE}")
 
 if __name__ == "__main__":
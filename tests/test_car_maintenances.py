@@ -0,0 +1,231 @@
+import importlib.util
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date, timedelta
+from pathlib import Path
+from unittest import mock
+
+import car_maintenances as cm
+
+HERE = Path(__file__).resolve().parent.parent
+CAMRY_RULES = HERE / "2018_Camry_schedule_rules.yaml"
+SIENNA_RULES = HERE / "2020_Sienna_schedule_rules.yaml"
+
+
+class HistoryTestCase(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.folder = Path(self.tmp.name)
+
+    def write_csv(self, text, name="Test_data.csv"):
+        path = self.folder / name
+        path.write_text(text, encoding="utf-8")
+        return path
+
+    def rules(self, source=CAMRY_RULES):
+        # load a copy so the rules cache sidecar lands in the temp dir
+        rules_file = self.folder / source.name
+        if not rules_file.exists():
+            shutil.copy(source, rules_file)
+        return cm.load_rules(rules_file)["rules"]
+
+    def due(self, path, mileage=5000):
+        df = cm.normalize_services(cm.read_data(path))
+        rows = cm.compute_next_due(df, mileage, date(2024, 6, 1), self.rules())
+        return {r["label"]: r for r in rows}
+
+
+class BlankCellTests(HistoryTestCase):
+    def oil_row(self, rows):
+        return next(r for label, r in rows.items() if "oil" in label.lower())
+
+    def test_matching_row_without_date(self):
+        path = self.write_csv("date,mileage,service,note\n,1000,Oil Change,\n")
+        row = self.oil_row(self.due(path))
+        self.assertIsNone(row["last_date"])
+        self.assertEqual(row["last_mileage"], 1000)
+
+    def test_matching_row_without_mileage(self):
+        path = self.write_csv("date,mileage,service,note\n01/05/2024,,Oil Change,\n")
+        row = self.oil_row(self.due(path))
+        self.assertEqual(row["last_date"], "01/05/2024")
+        self.assertIsNone(row["last_mileage"])
+
+
+class EnsureDataTests(HistoryTestCase):
+    def lines(self, path):
+        return path.read_text(encoding="utf-8").splitlines()
+
+    def test_creates_missing_file(self):
+        path = self.folder / "New_data.csv"
+        cm.ensure_data(path)
+        self.assertEqual(self.lines(path), ["date,mileage,service,note"])
+
+    def test_empty_file_gets_header(self):
+        path = self.write_csv("")
+        cm.ensure_data(path)
+        self.assertEqual(self.lines(path), ["date,mileage,service,note"])
+
+    def test_reordered_header_is_rewritten(self):
+        path = self.write_csv("service,shop,note,date,mileage\n"
+                              "Oil Change,Dealer,synthetic,01/05/2024,1000\n")
+        cm.ensure_data(path)
+        self.assertEqual(self.lines(path), [
+            "date,mileage,service,note,shop",
+            "01/05/2024,1000,Oil Change,synthetic,Dealer",
+        ])
+
+    def test_missing_note_column_is_added(self):
+        path = self.write_csv("date,mileage,service\n01/05/2024,1000,Oil Change\n")
+        cm.ensure_data(path)
+        self.assertEqual(self.lines(path), [
+            "date,mileage,service,note",
+            "01/05/2024,1000,Oil Change,",
+        ])
+
+    def test_missing_mileage_defaults_to_zero(self):
+        path = self.write_csv("date,service,note\n01/05/2024,Oil Change,\n")
+        cm.ensure_data(path)
+        self.assertEqual(self.lines(path), [
+            "date,mileage,service,note",
+            "01/05/2024,0,Oil Change,",
+        ])
+
+    def test_bom_prefixed_file_is_left_alone(self):
+        path = self.folder / "Bom_data.csv"
+        raw = "\ufeffdate,mileage,service,note\r\n01/05/2024,1000,Oil Change,\r\n".encode("utf-8")
+        path.write_bytes(raw)
+        cm.ensure_data(path)
+        self.assertEqual(path.read_bytes(), raw)
+
+
+class AppendRecordTests(HistoryTestCase):
+    def test_adds_missing_final_newline(self):
+        path = self.write_csv("date,mileage,service,note\n01/01/2024,2000,Tire Rotation,")
+        cm.append_record(path, ["02/01/2024", 2100.0, "Oil Change", ""])
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines(), [
+            "date,mileage,service,note",
+            "01/01/2024,2000,Tire Rotation,",
+            "02/01/2024,2100.0,Oil Change,",
+        ])
+
+    def test_recreates_header_for_missing_file(self):
+        path = self.folder / "Gone_data.csv"
+        cm.append_record(path, ["02/01/2024", 2100.0, "Oil Change", ""])
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines(), [
+            "date,mileage,service,note",
+            "02/01/2024,2100.0,Oil Change,",
+        ])
+
+    def test_writes_header_into_empty_file(self):
+        path = self.write_csv("")
+        cm.append_record(path, ["01/01/2024", 1.0, "x", ""])
+        self.assertEqual(path.read_text(encoding="utf-8").splitlines(), [
+            "date,mileage,service,note",
+            "01/01/2024,1.0,x,",
+        ])
+
+
+@unittest.skipIf(cm.ahocorasick is None, "pyahocorasick not installed")
+class AutomatonTests(HistoryTestCase):
+    # rows that exercise punctuation in keywords and keywords shared by rules
+    EXTRA_ROWS = ("01/02/2025,50000,Replaced air filter (engine),\n"
+                  "01/03/2025,50100,Engine coolant flush,\n"
+                  "01/04/2025,50200,,\n")
+
+    def assert_same_masks(self, rules_source):
+        csv_source = cm.rules_to_data_path(rules_source)
+        text = csv_source.read_text(encoding="utf-8-sig").rstrip("\n") + "\n" + self.EXTRA_ROWS
+        df = cm.normalize_services(cm.read_data(self.write_csv(text, csv_source.name)))
+        rules = self.rules(rules_source)
+        plain = cm.rule_masks(df, rules)
+        fast = cm.rule_masks(df, rules, cm.build_automaton(rules))
+        self.assertEqual(len(plain), len(fast))
+        for rule, a, b in zip(rules, plain, fast):
+            self.assertEqual(a.tolist(), b.tolist(), rule.get("key"))
+        engine_air = next(m for r, m in zip(rules, plain) if "air filter (engine)" in r["_match_lower"])
+        self.assertTrue(engine_air[len(df) - 3])
+
+    def test_camry(self):
+        self.assert_same_masks(CAMRY_RULES)
+
+    def test_sienna(self):
+        self.assert_same_masks(SIENNA_RULES)
+
+
+@unittest.skipIf(importlib.util.find_spec("pyarrow") is None, "pyarrow not installed")
+class FeatherMirrorTests(HistoryTestCase):
+    def test_restored_older_csv_is_not_shadowed_by_mirror(self):
+        path = self.write_csv("date,mileage,service,note\n"
+                              "01/01/2024,2000,Tire Rotation,\n02/01/2024,2100,Oil Change,\n")
+        self.assertEqual(len(cm.read_data(path)), 2)
+        # a restored backup keeps its older mtime (cp -p, shutil.copy2, Explorer)
+        old = os.stat(path).st_mtime_ns - 10**10
+        path.write_text("date,mileage,service,note\n01/01/2024,2000,Tire Rotation,\n", encoding="utf-8")
+        os.utime(path, ns=(old, old))
+        self.assertEqual(len(cm.read_data(path)), 1)
+
+    def test_mirror_from_other_format_version_is_ignored(self):
+        import pandas as pd
+        path = self.write_csv("date,mileage,service,note\n01/01/2024,2000,Tire Rotation,\n")
+        with mock.patch.object(cm, "MIRROR_FORMAT", "v0"):
+            cm.read_data(path)
+        with mock.patch("pandas.read_csv", wraps=pd.read_csv) as read_csv:
+            cm.read_data(path)
+            self.assertEqual(read_csv.call_count, 1)
+            cm.read_data(path)
+            self.assertEqual(read_csv.call_count, 1)
+
+
+class RulesCacheTests(HistoryTestCase):
+    def test_warm_load_matches_cold_load(self):
+        rules_file = self.folder / "Test_schedule_rules.yaml"
+        rules_file.write_text(
+            "vehicle_name: Test\n"
+            "rules:\n"
+            "  - key: oil\n"
+            "    match: [oil]\n"
+            "    baseline_date: 2020-01-05 10:00:00\n"
+            "  - key: coolant\n"
+            "    match: [coolant]\n"
+            "    baseline_date: 2020-02-01\n",
+            encoding="utf-8")
+        cold = cm.load_rules(rules_file)
+        self.assertTrue(cm.rules_cache_path(rules_file).exists())
+        warm = cm.load_rules(rules_file)
+        for c, w in zip(cold["rules"], warm["rules"]):
+            self.assertEqual(cm.parse_flexible_date(c["baseline_date"]),
+                             cm.parse_flexible_date(w["baseline_date"]))
+        self.assertEqual(cm.parse_flexible_date(warm["rules"][0]["baseline_date"]), date(2020, 1, 5))
+
+
+class AddMonthsTests(unittest.TestCase):
+    def test_clamps_to_month_end(self):
+        self.assertEqual(cm._add_months(date(2023, 1, 31), 1), date(2023, 2, 28))
+        self.assertEqual(cm._add_months(date(2024, 1, 31), 1), date(2024, 2, 29))
+        self.assertEqual(cm._add_months(date(2024, 2, 29), 12), date(2025, 2, 28))
+        self.assertEqual(cm._add_months(date(2024, 2, 29), 48), date(2028, 2, 29))
+        self.assertEqual(cm._add_months(date(2024, 3, 31), 6), date(2024, 9, 30))
+
+    def test_year_rollover(self):
+        self.assertEqual(cm._add_months(date(2024, 11, 15), 2), date(2025, 1, 15))
+        self.assertEqual(cm._add_months(date(2024, 12, 31), 1), date(2025, 1, 31))
+        self.assertEqual(cm._add_months(date(2024, 7, 4), 120), date(2034, 7, 4))
+
+    def test_matches_relativedelta(self):
+        try:
+            from dateutil.relativedelta import relativedelta
+        except ImportError:
+            self.skipTest("python-dateutil not installed")
+        d = date(2012, 1, 1)
+        while d < date(2031, 1, 1):
+            for n in (1, 3, 6, 12, 24, 36, 60, 120):
+                self.assertEqual(cm._add_months(d, n), d + relativedelta(months=n), (d, n))
+            d += timedelta(days=1)
+
+
+if __name__ == "__main__":
+    unittest.main()
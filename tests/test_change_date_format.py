@@ -0,0 +1,25 @@
+import unittest
+
+import pandas as pd
+
+from change_date_format import parse_mixed_dates
+
+
+class ParseMixedDatesTests(unittest.TestCase):
+    def parse(self, *values):
+        col = pd.Series(values, dtype="string")
+        return [None if pd.isna(d) else d.strftime("%m/%d/%Y") for d in parse_mixed_dates(col)]
+
+    def test_seven_digits_are_single_digit_month(self):
+        self.assertEqual(self.parse("5022018", "1012018", "1312018", "9302019"),
+                         ["05/02/2018", "01/01/2018", "01/31/2018", "09/30/2019"])
+
+    def test_eight_digits(self):
+        self.assertEqual(self.parse("12052018", "01012018"), ["12/05/2018", "01/01/2018"])
+
+    def test_other_lengths_are_invalid(self):
+        self.assertEqual(self.parse("512018", "120520181", "", "1322018"), [None, None, None, None])
+
+
+if __name__ == "__main__":
+    unittest.main()